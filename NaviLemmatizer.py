@@ -1,5 +1,7 @@
 import json
-from logger import log, logger
+import re
+from functools import lru_cache
+from logger import logger
 from pathlib import Path
 
 
@@ -10,6 +12,27 @@ class NaviLemmatizer:
         self.verb_suffix = ["ie", "i", "u", "ìm"]
         self.number_prefix = ["ay", "me", "pxe"]
 
+        self._prefixes = tuple(self.number_prefix)
+        self._case_suffix_sorted = tuple(
+            sorted(self.case_suffix, key=len, reverse=True)
+        )
+        self._verb_suffix_sorted = tuple(
+            sorted(self.verb_suffix, key=len, reverse=True)
+        )
+
+        # One anchored alternation per affix group, longest first. The
+        # lookarounds keep at least two characters of stem, as the
+        # length checks of the per-affix loops did.
+        self._num_re = re.compile(
+            r"^(?:" + "|".join(map(re.escape, self._prefixes)) + r")(?=..)"
+        )
+        self._case_re = re.compile(
+            r"(?<=..)(?:" + "|".join(map(re.escape, self._case_suffix_sorted)) + r")$"
+        )
+        self._verb_re = re.compile(
+            r"(?:" + "|".join(map(re.escape, self._verb_suffix_sorted)) + r")$"
+        )
+
         path = Path(exceptions_path)
         if path.exists():
             try:
@@ -22,31 +45,29 @@ class NaviLemmatizer:
             logger.info("No exceptions file found.")
             self.lemma_exceptions = {}
 
-    @log
+        self._form_to_lemma = {}
+        for lemma, forms in self.lemma_exceptions.items():
+            self._form_to_lemma.setdefault(lemma, lemma)
+            for form in forms:
+                self._form_to_lemma.setdefault(form, lemma)
+
+        # Tokens repeat heavily across sentences, so lemmas are memoized per
+        # instance; the cache assumes the exception table is not mutated.
+        self._lemmatize_cached = lru_cache(maxsize=8192)(self._lemmatize)
+
     def lemmatize(self, word: str) -> str:
         if not isinstance(word, str):
             raise TypeError("Word must be a string")
 
-        original = word
-        word = word.lower()
+        return self._lemmatize_cached(word)
 
-        for lemma, forms in self.lemma_exceptions.items():
-            if word in forms or word == lemma:
-                return lemma
-
-        for prefix in self.number_prefix:
-            if word.startswith(prefix) and len(word) > len(prefix) + 1:
-                word = word[len(prefix) :]
-                break
-
-        for suffix in sorted(self.case_suffix, key=len, reverse=True):
-            if word.endswith(suffix) and len(word) > len(suffix) + 1:
-                word = word[: -len(suffix)]
-                break
-
-        for suffix in sorted(self.verb_suffix, key=len, reverse=True):
-            if word.endswith(suffix):
-                word = word[: -len(suffix)]
-                break
+    def _lemmatize(self, word: str) -> str:
+        hit = self._form_to_lemma.get(word)
+        if hit is not None:
+            return hit
+
+        word = self._num_re.sub("", word, count=1)
+        word = self._case_re.sub("", word, count=1)
+        word = self._verb_re.sub("", word, count=1)
 
         return word
@@ -1,13 +1,88 @@
 import os
+import sys
+import csv
+import copy
+import time
+import atexit
 import yaml
+import pickle
+import hashlib
+import marisa_trie
 import pandas as pd
-import requests
-import matplotlib.pyplot as plt
 
 from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass
 from logger import logger, log
 from NaviLemmatizer import NaviLemmatizer
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default_cache_dir() -> str:
+    # Cache files are unpickled, so they live in a per-user directory
+    # rather than one relative to the working directory.
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "navi-parser")
+
+
+CACHE_DIR = _default_cache_dir()
+CACHE_VERSION = 4
+
+# One background writer shared by every parser; queued writes are
+# drained at interpreter exit.
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="navi-writer")
+atexit.register(_WRITER.shutdown, wait=True)
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _load_config(config_path: str) -> Dict[str, Any]:
+    key = (os.path.abspath(config_path), os.path.getmtime(config_path))
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        _CONFIG_CACHE[key] = config
+    return copy.deepcopy(config)
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class NaviEntry:
+    navi: str
+    syllabic: str
+    acoustic: str
+    pos: str
+    translations: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "navi": self.navi,
+            "syllabic": self.syllabic,
+            "acoustic": self.acoustic,
+            "pos": self.pos,
+            "translations": list(self.translations),
+        }
 
 
 class AbstractProvider(ABC):
@@ -17,64 +92,116 @@ class AbstractProvider(ABC):
         self.retries = retries
 
     @abstractmethod
-    def load(self) -> List[Dict[str, Any]]:
+    def load(self) -> List[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def extract_word_info(self, item: Any) -> NaviEntry:
+        raise NotImplementedError
+
+    @abstractmethod
+    def cache_key(self) -> str:
         raise NotImplementedError
 
     @abstractmethod
-    def extract_word_info(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def cache_stamp(self) -> Any:
         raise NotImplementedError
 
 
 class TSVProvider(AbstractProvider):
+    COLUMNS = ("Word (Na'vi)", "POS", "Translation (en)")
+
     def __init__(self, file_path: str):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"TSV file not found.")
         super().__init__(url="", timeout=0, retries=0)
         self.file_path = file_path
 
-    def load(self) -> List[Dict[str, Any]]:
+    def load(self) -> List[NaviEntry]:
         try:
-            df = pd.read_csv(self.file_path, sep="\t")
-            if not all(
-                col in df.columns for col in ["Word (Na'vi)", "POS", "Translation (en)"]
-            ):
+            columns = self._read_columns()
+            if columns is None:
                 logger.warning("TSV file missing expected columns")
                 return []
 
-            data_list = []
-            for i, row in df.iterrows():
-                item = {
-                    "navi": str(row["Word (Na'vi)"]).strip().lower(),
-                    "pos": str(row["POS"]).strip(),
-                    "translations": [str(row["Translation (en)"]).strip()],
-                    "syllabic": "",
-                    "acoustic": "",
-                }
-                data_list.append(item)
-            return data_list
+            navi, pos, translations = columns
+            return [
+                NaviEntry(
+                    navi=n,
+                    syllabic="",
+                    acoustic="",
+                    pos=_intern(p),
+                    translations=(t,),
+                )
+                for n, p, t in zip(navi, pos, translations)
+            ]
         except Exception as e:
             logger.exception(f"Failed to read TSV file: {e}")
             return []
 
-    def extract_word_info(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "navi": item.get("navi", ""),
-            "syllabic": item.get("syllabic", ""),
-            "acoustic": item.get("acoustic", ""),
-            "pos": item.get("pos", "unknown"),
-            "translations": item.get("translations", []),
-        }
+    def _read_columns(self):
+        if pacsv is not None:
+            try:
+                return self._read_columns_arrow()
+            except pa.ArrowInvalid as e:
+                logger.warning(f"PyArrow could not parse TSV, using pandas: {e}")
+        return self._read_columns_pandas()
+
+    def _read_columns_arrow(self):
+        table = pacsv.read_csv(
+            self.file_path,
+            parse_options=pacsv.ParseOptions(delimiter="\t"),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: pa.string() for col in self.COLUMNS}
+            ),
+        )
+        if not all(col in table.column_names for col in self.COLUMNS):
+            return None
+
+        navi, pos, translations = (table.column(col) for col in self.COLUMNS)
+        return (
+            pc.utf8_lower(pc.utf8_trim_whitespace(navi)).to_pylist(),
+            pc.utf8_trim_whitespace(pos).to_pylist(),
+            pc.utf8_trim_whitespace(translations).to_pylist(),
+        )
+
+    def _read_columns_pandas(self):
+        df = pd.read_csv(self.file_path, sep="\t", dtype=str, keep_default_na=False)
+        if not all(col in df.columns for col in self.COLUMNS):
+            return None
+
+        navi, pos, translations = (df[col].str.strip() for col in self.COLUMNS)
+        return (
+            navi.str.lower().tolist(),
+            pos.tolist(),
+            translations.tolist(),
+        )
+
+    def extract_word_info(self, item: NaviEntry) -> NaviEntry:
+        return item
+
+    def cache_key(self) -> str:
+        return f"tsv:{os.path.abspath(self.file_path)}"
+
+    def cache_stamp(self) -> Any:
+        return os.path.getmtime(self.file_path)
 
 
 class DictNaviProvider(AbstractProvider):
+    CACHE_TTL = 24 * 60 * 60
 
     def load(self) -> List[Dict[str, Any]]:
+        import requests
+
         for attempt in range(self.retries):
             try:
                 logger.info(f"Loading DictNavi API (attempt {attempt+1})")
                 response = requests.get(self.url, timeout=self.timeout)
                 response.raise_for_status()
-                data = response.json()
+                if orjson is not None:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
                 if not isinstance(data, list):
                     logger.warning(
                         "DictNavi returned non-list response; expected list."
@@ -86,19 +213,29 @@ class DictNaviProvider(AbstractProvider):
         logger.error("DictNavi API unreachable")
         return []
 
-    def extract_word_info(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "navi": item.get("navi", ""),
-            "syllabic": item.get("syllabic", ""),
-            "acoustic": item.get("acoustic", ""),
-            "pos": item.get("wordclass", "unknown"),
-            "translations": item.get("translations", []),
-        }
+    def extract_word_info(self, item: Dict[str, Any]) -> NaviEntry:
+        return NaviEntry(
+            navi=item.get("navi", "").lower(),
+            syllabic=_intern(item.get("syllabic", "")),
+            acoustic=_intern(item.get("acoustic", "")),
+            pos=_intern(item.get("wordclass", "unknown")),
+            translations=tuple(item.get("translations") or ()),
+        )
+
+    def cache_key(self) -> str:
+        return f"api:{self.url}"
+
+    def cache_stamp(self) -> Any:
+        return int(time.time() // self.CACHE_TTL)
 
 
 class NaviParser:
+    # The apostrophe is the Na'vi glottal stop ("tsa'u"), so it is kept.
+    _punct_tab = str.maketrans("", "", '.,!?;:"')
+    _columns = ("navi", "syllabic", "acoustic", "pos", "translations")
+
     def __init__(self, config_path="config.yaml"):
-        self.config = yaml.safe_load(open(config_path, "r", encoding="utf-8"))
+        self.config = _load_config(config_path)
         self.lemmatizer = NaviLemmatizer()
 
         provider_cfg = self.config.get("provider", {})
@@ -120,42 +257,97 @@ class NaviParser:
             raise ValueError(f"Unknown provider type: {provider_type}")
 
         logger.info(f"Using provider: {provider_type}")
-        self.data_list = self.provider.load()
+        self._rows, self._trie = self._load_index()
         self.results = []
 
-    @log
+    def _load_index(self):
+        # One file per source: a changed source or format overwrites it
+        # instead of leaving the old file behind.
+        digest = hashlib.sha1(self.provider.cache_key().encode("utf-8")).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, f"{digest}.pkl")
+        stamp = (CACHE_VERSION, self.provider.cache_stamp())
+
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    cached_stamp, raw_rows, trie = pickle.load(f)
+                if cached_stamp == stamp:
+                    rows = [NaviEntry(*raw) for raw in raw_rows]
+                    logger.info(f"Dictionary loaded from cache {cache_path}")
+                    return rows, trie
+                logger.info("Dictionary cache is stale, rebuilding")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable dictionary cache: {e}")
+
+        rows, trie = self._build_index(self.provider.load())
+        if rows:
+            try:
+                os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+                tmp_path = f"{cache_path}.tmp"
+                # Rows are stored as plain tuples so the file does not
+                # depend on the module path NaviEntry was pickled under.
+                raw_rows = [astuple(row) for row in rows]
+                with open(tmp_path, "wb") as f:
+                    pickle.dump((stamp, raw_rows, trie), f, protocol=5)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write dictionary cache: {e}")
+        return rows, trie
+
+    def _build_index(self, data_list):
+        rows = {}
+        for item in data_list:
+            row = self.provider.extract_word_info(item)
+            key = row.navi
+            if key:
+                rows.setdefault(key, row)
+
+        trie = marisa_trie.Trie(rows)
+        ordered = [None] * len(trie)
+        for key, row in rows.items():
+            ordered[trie[key]] = row
+        return ordered, trie
+
     def tokenize(self, sentence):
-        return [w.strip(".,!?") for w in sentence.split()]
+        return sentence.translate(self._punct_tab).split()
 
-    @log
     def get_word_info(self, word):
         lemma = self.lemmatizer.lemmatize(word.lower())
+        return self._word_info(word, lemma)
 
-        match = next(
-            (item for item in self.data_list if item.get("navi", "").lower() == lemma),
-            None,
-        )
+    def _word_info(self, word, lemma):
+        idx = self._trie.get(lemma)
 
-        if match:
-            return self.provider.extract_word_info(match)
+        if idx is not None:
+            return self._rows[idx].to_dict()
 
-        return {
-            "navi": word,
-            "syllabic": "",
-            "acoustic": "",
-            "pos": "unknown",
-            "translations": [],
-        }
+        return NaviEntry(
+            navi=word, syllabic="", acoustic="", pos="unknown", translations=()
+        ).to_dict()
 
     @log
     def parse_sentence(self, sentence):
-        tokens = self.tokenize(sentence)
-        self.results = [self.get_word_info(t) for t in tokens]
-        return pd.DataFrame(self.results)
+        try:
+            tokens = self.tokenize(sentence)
+            unique = list(dict.fromkeys(tokens))
+            infos = {
+                t: self._word_info(t, self.lemmatizer.lemmatize(t.lower()))
+                for t in unique
+            }
+            self.results = [dict(infos[t]) for t in tokens]
+            return pd.DataFrame.from_records(self.results, columns=self._columns)
+        except Exception:
+            logger.exception("Failed to parse sentence: %r", sentence)
+            raise
 
     @log
     def save_results_tsv(self, filename="results.tsv"):
+        """Queue the current results for writing to "tsv files output/".
 
+        Returns the Future of the background write, or None when there are
+        no results to save. Write errors are logged by the writer and are
+        only raised to the caller through Future.result().
+        """
         if not self.results:
             print("No results to save.")
             return
@@ -163,8 +355,27 @@ class NaviParser:
         os.makedirs("tsv files output", exist_ok=True)
         file_path = os.path.join("tsv files output", filename)
 
-        df = pd.DataFrame(self.results)
-        df.to_csv(file_path, sep="\t", index=False, encoding="utf-8")
+        df = pd.DataFrame.from_records(self.results, columns=self._columns)
+        return _WRITER.submit(self._write_tsv, df, file_path)
+
+    def flush(self):
+        """Block until every queued TSV write, from any parser, has finished."""
+        _WRITER.submit(lambda: None).result()
+
+    @staticmethod
+    def _write_tsv(df, file_path):
+        try:
+            df.to_csv(
+                file_path,
+                sep="\t",
+                index=False,
+                encoding="utf-8",
+                lineterminator="\n",
+                quoting=csv.QUOTE_MINIMAL,
+            )
+        except Exception as e:
+            logger.exception(f"Failed to save results to {file_path}: {e}")
+            raise
         logger.info(f"Results saved to {file_path}")
 
     @log
@@ -173,20 +384,25 @@ class NaviParser:
             print("There's no data for plot creation.")
             return
 
-        df = pd.DataFrame(self.results)
-        counts = df["pos"].value_counts()
+        # A standalone Figure renders straight to file without pyplot, so
+        # plotting neither starts a GUI backend nor changes the host's one.
+        from matplotlib.figure import Figure
+
+        counts = Counter(r.get("pos", "unknown") for r in self.results)
+        labels, values = zip(*counts.most_common())
 
         os.makedirs("pos_distributions", exist_ok=True)
         file_path = os.path.join("pos_distributions", "pos_distribution.png")
 
-        plt.bar(counts.index, counts.values)
-        plt.xlabel("POS")
-        plt.ylabel("Quantity")
-        plt.title("POS distribution")
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(file_path)
-        plt.close()
+        fig = Figure()
+        ax = fig.subplots()
+        ax.bar(labels, values)
+        ax.set_xlabel("POS")
+        ax.set_ylabel("Quantity")
+        ax.set_title("POS distribution")
+        ax.tick_params(axis="x", labelrotation=45)
+        fig.tight_layout()
+        fig.savefig(file_path)
 
 
 if __name__ == "__main__":
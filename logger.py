@@ -14,13 +14,11 @@ if not logger.handlers:
 def log(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger.info(f"Calling {func.__name__}")
-        try:
-            result = func(*args, **kwargs)
-            logger.info(f"{func.__name__} finished successfully")
-            return result
-        except Exception as e:
-            logger.exception(f"{func.__name__} failed: {e}")
-            raise
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calling %s", func.__name__)
+        result = func(*args, **kwargs)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s finished successfully", func.__name__)
+        return result
 
     return wrapper
@@ -1,7 +1,9 @@
+import os
+import pickle
 import pytest
 from unittest.mock import MagicMock
 from NaviLemmatizer import NaviLemmatizer
-from NaviParser import NaviParser
+from NaviParser import NaviParser, NaviEntry, TSVProvider
 
 
 def test_lemmatize_simple():
@@ -21,13 +23,13 @@ def parser():
     p = NaviParser.__new__(NaviParser)
     p.lemmatizer = NaviLemmatizer()
     p.provider = MagicMock()
-    p.provider.extract_word_info.side_effect = lambda item: {
-        "navi": item["navi"],
-        "syllabic": item.get("syllabic", ""),
-        "acoustic": item.get("acoustic", ""),
-        "pos": item.get("wordclass", "unknown"),
-        "translations": item.get("translations", []),
-    }
+    p.provider.extract_word_info.side_effect = lambda item: NaviEntry(
+        navi=item["navi"],
+        syllabic=item.get("syllabic", ""),
+        acoustic=item.get("acoustic", ""),
+        pos=item.get("wordclass", "unknown"),
+        translations=tuple(item.get("translations", [])),
+    )
 
     p.data_list = [
         {
@@ -45,6 +47,7 @@ def parser():
             "translations": ["you"],
         },
     ]
+    p._rows, p._trie = p._build_index(p.data_list)
 
     return p
 
@@ -54,6 +57,11 @@ def test_tokenize(parser):
     assert tokens == ["Oel", "ngati", "kameie", "ma", "tsmukan"]
 
 
+def test_tokenize_keeps_apostrophe(parser):
+    tokens = parser.tokenize('Tsa\'u: "kaltxì";')
+    assert tokens == ["Tsa'u", "kaltxì"]
+
+
 def test_get_word_info_found(parser):
     parser.lemmatizer.lemmatize = lambda w: "ngati"
     info = parser.get_word_info("ngati")
@@ -62,9 +70,163 @@ def test_get_word_info_found(parser):
     assert info["translations"] == ["you"]
 
 
+def test_parse_sentence(parser):
+    parser.lemmatizer.lemmatize = lambda w: w
+    df = parser.parse_sentence("Oel ngati, oel!")
+    assert list(df.columns) == ["navi", "syllabic", "acoustic", "pos", "translations"]
+    assert df["navi"].tolist() == ["oel", "ngati", "oel"]
+    assert df["pos"].tolist() == ["noun", "pronoun", "noun"]
+
+    parser.results[0]["pos"] = "X"
+    assert parser.results[2]["pos"] == "noun"
+
+
 def test_get_word_info_not_found(parser):
     parser.lemmatizer.lemmatize = lambda w: w
     info = parser.get_word_info("unknownword")
     assert info["navi"] == "unknownword"
     assert info["pos"] == "unknown"
     assert info["translations"] == []
+
+
+TSV_WITH_BLANKS = (
+    "Word (Na'vi)\tPOS\tTranslation (en)\n"
+    " Kaltxì \tintj.\thello\n"
+    "nga\t\tyou\n"
+    "\tn.\tnothing\n"
+)
+
+
+def test_tsv_load_blank_cells(tmp_path, monkeypatch):
+    monkeypatch.setattr("NaviParser.pacsv", None)
+    path = tmp_path / "dict.tsv"
+    path.write_text(TSV_WITH_BLANKS, encoding="utf-8")
+
+    entries = TSVProvider(str(path)).load()
+    assert entries == [
+        NaviEntry("kaltxì", "", "", "intj.", ("hello",)),
+        NaviEntry("nga", "", "", "", ("you",)),
+        NaviEntry("", "", "", "n.", ("nothing",)),
+    ]
+
+
+def test_tsv_readers_agree(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "dict.tsv"
+    path.write_text(TSV_WITH_BLANKS + "nan\tNA\tnull\n", encoding="utf-8")
+
+    arrow_entries = TSVProvider(str(path)).load()
+    monkeypatch.setattr("NaviParser.pacsv", None)
+    pandas_entries = TSVProvider(str(path)).load()
+
+    assert arrow_entries == pandas_entries
+    assert arrow_entries[-1] == NaviEntry("nan", "", "", "NA", ("null",))
+
+
+def test_save_results_tsv_flush(parser, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    parser.lemmatizer.lemmatize = lambda w: w
+    parser.parse_sentence("Oel ngati")
+
+    future = parser.save_results_tsv("out.tsv")
+    parser.flush()
+
+    assert future.done() and future.exception() is None
+    lines = (tmp_path / "tsv files output" / "out.tsv").read_text("utf-8").splitlines()
+    assert lines[0] == "navi\tsyllabic\tacoustic\tpos\ttranslations"
+    assert [line.split("\t")[0] for line in lines[1:]] == ["oel", "ngati"]
+
+
+def test_save_results_tsv_without_results(parser):
+    parser.results = []
+    assert parser.save_results_tsv() is None
+
+
+@pytest.fixture
+def tsv_config(tmp_path, monkeypatch):
+    monkeypatch.setattr("NaviParser.CACHE_DIR", str(tmp_path / "cache"))
+    tsv = tmp_path / "dict.tsv"
+    tsv.write_text("Word (Na'vi)\tPOS\tTranslation (en)\nnga\tpn.\tyou\n", "utf-8")
+    config = tmp_path / "config.yaml"
+    config.write_text(f'provider:\n  type: "tsv"\n  tsv_path: "{tsv.as_posix()}"\n')
+
+    loads = []
+    original_load = TSVProvider.load
+
+    def counting_load(self):
+        loads.append(self.file_path)
+        return original_load(self)
+
+    monkeypatch.setattr(TSVProvider, "load", counting_load)
+    return str(config), tsv, loads
+
+
+def test_index_cache_hit(tsv_config):
+    config, tsv, loads = tsv_config
+
+    NaviParser(config)
+    parser = NaviParser(config)
+
+    assert len(loads) == 1
+    assert parser.get_word_info("nga")["pos"] == "pn."
+
+
+def test_index_cache_invalidated_by_mtime(tsv_config, tmp_path):
+    config, tsv, loads = tsv_config
+
+    NaviParser(config)
+    mtime = tsv.stat().st_mtime + 10
+    os.utime(tsv, (mtime, mtime))
+    NaviParser(config)
+    NaviParser(config)
+
+    assert len(loads) == 2
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_index_cache_skips_empty_load(tsv_config, tmp_path):
+    config, tsv, loads = tsv_config
+    tsv.write_text("unexpected\theader\n", "utf-8")
+
+    NaviParser(config)
+    NaviParser(config)
+
+    assert len(loads) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_config_not_shared_between_parsers(tsv_config):
+    config, tsv, loads = tsv_config
+
+    first = NaviParser(config)
+    first.config["provider"]["type"] = "api"
+    second = NaviParser(config)
+
+    assert second.config["provider"]["type"] == "tsv"
+
+
+def test_index_cache_round_trip(tsv_config, tmp_path):
+    config, tsv, loads = tsv_config
+
+    first = NaviParser(config)
+    (cache_file,) = (tmp_path / "cache").iterdir()
+    with open(cache_file, "rb") as f:
+        stamp, raw_rows, trie = pickle.load(f)
+    second = NaviParser(config)
+
+    assert raw_rows == [("nga", "", "", "pn.", ("you",))]
+    assert len(loads) == 1
+    assert second._rows == first._rows
+    assert second.get_word_info("nga") == first.get_word_info("nga")
+
+
+def test_plot_pos_distribution(parser, tmp_path, monkeypatch):
+    pytest.importorskip("matplotlib")
+    monkeypatch.chdir(tmp_path)
+    parser.lemmatizer.lemmatize = lambda w: w
+    parser.parse_sentence("Oel ngati oel")
+
+    parser.plot_pos_distribution()
+
+    png = tmp_path / "pos_distributions" / "pos_distribution.png"
+    assert png.read_bytes().startswith(b"\x89PNG")